@@ -4,11 +4,11 @@
 import atexit
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
-from queue import Queue
-from threading import Thread
+from threading import Event, Lock, Thread, Timer
 
 
 # Configuration constants
@@ -20,6 +20,8 @@ class MotorConfig:
     STOP_SPEED = 0.0
     RAMP_TIME = 0.1  # Time to ramp up/down speeds
     MAX_ACCELERATION = 2.0  # Max speed change per second
+    THROTTLE_DEADBAND = 1 / 256  # Skip I2C writes for smaller changes
+    STEER_GAIN = 0.5  # Differential share of the direction in steer()
 
 
 class Direction(Enum):
@@ -42,6 +44,22 @@ class RobotState(Enum):
     EMERGENCY_STOP = "emergency_stop"
 
 
+# RobotCar stores its state as a plain int indexing _STATE_NAMES (the
+# RobotState member names, as reported by get_status) rather than an enum member
+_STATE_NAMES = tuple(state.name for state in RobotState)
+(
+    _ST_STOPPED,
+    _ST_MOVING_FORWARD,
+    _ST_MOVING_BACKWARD,
+    _ST_TURNING_LEFT,
+    _ST_TURNING_RIGHT,
+    _ST_SPINNING_LEFT,
+    _ST_SPINNING_RIGHT,
+    _ST_STEERING,
+    _ST_EMERGENCY_STOP,
+) = range(len(_STATE_NAMES))
+
+
 @dataclass
 class MotorSetup:
     """Configuration for motor setup"""
@@ -66,6 +84,61 @@ class MovementCommand:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Accepted speed types, built once rather than as an int | float union per call
+_NUMERIC = (int, float)
+
+
+def _validate_seconds(seconds: float | None) -> None:
+    """Validate an optional movement duration."""
+    if seconds is not None and seconds < 0:
+        raise ValueError("seconds must be non-negative")
+
+
+def _differential_drive(speed: float, direction: float) -> tuple[float, float]:
+    """Convert (speed, direction) into normalized (left, right) motor speeds."""
+    offset = direction * MotorConfig.STEER_GAIN
+    left = speed + offset
+    right = speed - offset
+
+    # Normalize if speeds exceed limits
+    peak = max(abs(left), abs(right))
+    if peak > MotorConfig.MAX_SPEED:
+        scale = MotorConfig.MAX_SPEED / peak
+        return left * scale, right * scale
+    return left, right
+
+
+def _make_motor_setter(
+    motor, trim: float, inverted: bool, last: list, index: int, name: str
+) -> Callable[[float], None]:
+    """Build the speed setter of one motor with its trim and inversion baked in.
+
+    last[index] holds the throttle last written to the motor, so that
+    changes smaller than THROTTLE_DEADBAND skip the I2C write.
+    """
+    sign = -1.0 if inverted else 1.0
+    low = MotorConfig.MIN_SPEED
+    high = MotorConfig.MAX_SPEED
+    deadband = MotorConfig.THROTTLE_DEADBAND
+    # Bound setter of the DCMotor.throttle property: skips the attribute
+    # and descriptor lookup on each write
+    write_throttle = type(motor).throttle.fset.__get__(motor)
+
+    def set_speed(speed: float) -> None:
+        speed += trim
+        speed = sign * (low if speed < low else high if speed > high else speed)
+
+        previous = last[index]
+        if previous is not None and abs(speed - previous) < deadband:
+            return
+
+        write_throttle(speed)
+        last[index] = speed
+        logger.debug("%s motor speed set to %s", name, speed)
+
+    return set_speed
+
+
 try:
     from adafruit_crickit import crickit
 
@@ -94,7 +167,13 @@ try:
             self._dummy = False
             self._motor_config = motor_config or MotorSetup()
             self._is_moving = False
-            self._state = RobotState.STOPPED
+            self._state = _ST_STOPPED
+            self._stop_timer: Timer | None = None
+            self._stop_lock = Lock()
+
+            # Last throttle written to each motor (left, right), to skip
+            # redundant I2C writes
+            self._last_throttle: list[float | None] = [None, None]
 
             # Get motor references
             left_port = self._motor_config.left_motor_port
@@ -102,23 +181,51 @@ try:
             self._left_motor = getattr(crickit, f"dc_motor_{left_port}")
             self._right_motor = getattr(crickit, f"dc_motor_{right_port}")
 
+            # Per-motor setters: trim, clamp and inversion resolved once here.
+            # Callers pass speeds that are already validated.
+            self._left_speed = _make_motor_setter(
+                self._left_motor, left_trim,
+                self._motor_config.left_motor_inverted,
+                self._last_throttle, 0, "Left",
+            )
+            self._right_speed = _make_motor_setter(
+                self._right_motor, right_trim,
+                self._motor_config.right_motor_inverted,
+                self._last_throttle, 1, "Right",
+            )
+
             if stop_at_exit:
                 atexit.register(self.stop)
 
             logger.info(
-                f"RobotCar initialized with left_trim={left_trim}, "
-                f"right_trim={right_trim}"
+                "RobotCar initialized with left_trim=%s, right_trim=%s",
+                left_trim, right_trim,
             )
 
-            # Command processing setup
-            self._command_queue = Queue()
-            self._command_thread = Thread(target=self._process_commands)
+            # Action name -> method(speed, duration), for queued commands
+            self._actions: dict[str, Callable[[float, float | None], None]] = {
+                "forward": self.forward,
+                "backward": self.backward,
+                "turn_left": self.turn_left,
+                "turn_right": self.turn_right,
+                "spin_left": self.spin_left,
+                "spin_right": self.spin_right,
+                "stop": lambda speed, duration: self.stop(),
+            }
+
+            # Command processing setup: deque append/popleft are atomic, the
+            # event only wakes the worker when commands are waiting
+            self._command_queue: deque[MovementCommand] = deque()
+            self._command_event = Event()
+            self._command_thread = Thread(
+                target=self._process_commands, daemon=True, name="RobotCar-cmd"
+            )
             self._running = True
             self._command_thread.start()
 
         def _validate_speed(self, speed: float, param_name: str = "speed") -> None:
             """Validate speed parameter is within valid range."""
-            if not isinstance(speed, int | float):
+            if not isinstance(speed, _NUMERIC):
                 raise TypeError(f"{param_name} must be a number")
             min_speed = MotorConfig.MIN_SPEED
             max_speed = MotorConfig.MAX_SPEED
@@ -127,42 +234,47 @@ try:
                     f"{param_name} must be between {min_speed} and {max_speed}"
                 )
 
-        def _constrain_speed(self, speed: float) -> float:
-            """Constrain speed to valid range."""
-            return max(MotorConfig.MIN_SPEED, min(MotorConfig.MAX_SPEED, speed))
-
-        def _left_speed(self, speed: float) -> None:
-            """Set the speed of the left motor, taking into account its trim."""
-            self._validate_speed(speed)
-            speed += self._left_trim
-            speed = self._constrain_speed(speed)
+        def _cancel_stop(self) -> None:
+            """Cancel any pending timed stop.
 
-            # Apply inversion if configured
-            if self._motor_config.left_motor_inverted:
-                speed = -speed
-
-            self._left_motor.throttle = speed
-            logger.debug(f"Left motor speed set to {speed}")
-
-        def _right_speed(self, speed: float) -> None:
-            """Set the speed of the right motor, taking into account its trim."""
-            self._validate_speed(speed)
-            speed += self._right_trim
-            speed = self._constrain_speed(speed)
+            Called before the motors are written, so that a stale timer cannot
+            stop the movement that replaces the one it was armed for.
+            """
+            with self._stop_lock:
+                if self._stop_timer is not None:
+                    self._stop_timer.cancel()
+                    self._stop_timer = None
 
-            # Apply inversion if configured
-            if self._motor_config.right_motor_inverted:
-                speed = -speed
+        def _arm_stop(self, seconds: float | None) -> None:
+            """Arm a timed stop if seconds is given (already validated).
 
-            self._right_motor.throttle = speed
-            logger.debug(f"Right motor speed set to {speed}")
+            The stop runs on a timer thread so timed movements return at once
+            instead of blocking the caller for the whole duration.
+            """
+            if seconds is None:
+                return
+
+            def timed_stop() -> None:
+                with self._stop_lock:
+                    # Superseded by a newer movement: leave the motors alone
+                    if self._stop_timer is not timer:
+                        return
+                    self._stop_timer = None
+                    self.stop()
+
+            timer = Timer(seconds, timed_stop)
+            timer.daemon = True
+            with self._stop_lock:
+                self._stop_timer = timer
+            timer.start()
 
         def stop(self) -> None:
             """Stop all movement."""
             self._left_motor.throttle = MotorConfig.STOP_SPEED
             self._right_motor.throttle = MotorConfig.STOP_SPEED
+            self._last_throttle[:] = (MotorConfig.STOP_SPEED, MotorConfig.STOP_SPEED)
             self._is_moving = False
-            self._state = RobotState.STOPPED
+            self._state = _ST_STOPPED
             logger.info("Robot stopped")
 
         def is_moving(self) -> bool:
@@ -181,21 +293,19 @@ try:
                 seconds: Optional time to move before stopping
             """
             self._validate_speed(speed)
-            log_msg = f"Moving forward at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Moving forward at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Moving forward at speed %s", speed)
 
             self._left_speed(speed)
             self._right_speed(speed)
             self._is_moving = True
-            self._state = RobotState.MOVING_FORWARD
+            self._state = _ST_MOVING_FORWARD
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         def backward(
             self,
@@ -209,21 +319,19 @@ try:
                 seconds: Optional time to move before stopping
             """
             self._validate_speed(speed)
-            log_msg = f"Moving backward at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Moving backward at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Moving backward at speed %s", speed)
 
             self._left_speed(-speed)
             self._right_speed(-speed)
             self._is_moving = True
-            self._state = RobotState.MOVING_BACKWARD
+            self._state = _ST_MOVING_BACKWARD
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         def steer(self, speed: float, direction: float) -> None:
             """Move with steering control.
@@ -235,24 +343,17 @@ try:
             self._validate_speed(speed, "speed")
             self._validate_speed(direction, "direction")
 
-            # Calculate differential steering
-            left_speed = speed + (direction * 0.5)
-            right_speed = speed - (direction * 0.5)
-
-            # Normalize if speeds exceed limits
-            max_speed = max(abs(left_speed), abs(right_speed))
-            if max_speed > 1.0:
-                left_speed /= max_speed
-                right_speed /= max_speed
+            self._cancel_stop()
+            left_speed, right_speed = _differential_drive(speed, direction)
 
             self._left_speed(left_speed)
             self._right_speed(right_speed)
             self._is_moving = True
-            self._state = RobotState.STEERING
+            self._state = _ST_STEERING
 
             logger.debug(
-                f"Steering: speed={speed}, direction={direction}, "
-                f"left={left_speed}, right={right_speed}"
+                "Steering: speed=%s, direction=%s, left=%s, right=%s",
+                speed, direction, left_speed, right_speed,
             )
 
         def turn_left(
@@ -262,21 +363,19 @@ try:
         ) -> None:
             """Turn left by moving only the right motor."""
             self._validate_speed(speed)
-            log_msg = f"Turning left at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Turning left at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Turning left at speed %s", speed)
 
             self._left_speed(MotorConfig.STOP_SPEED)
             self._right_speed(speed)
             self._is_moving = True
-            self._state = RobotState.TURNING_LEFT
+            self._state = _ST_TURNING_LEFT
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         def turn_right(
             self,
@@ -285,21 +384,19 @@ try:
         ) -> None:
             """Turn right by moving only the left motor."""
             self._validate_speed(speed)
-            log_msg = f"Turning right at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Turning right at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Turning right at speed %s", speed)
 
             self._left_speed(speed)
             self._right_speed(MotorConfig.STOP_SPEED)
             self._is_moving = True
-            self._state = RobotState.TURNING_RIGHT
+            self._state = _ST_TURNING_RIGHT
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         def spin_left(
             self,
@@ -308,21 +405,19 @@ try:
         ) -> None:
             """Spin left in place by rotating motors in opposite directions."""
             self._validate_speed(speed)
-            log_msg = f"Spinning left at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Spinning left at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Spinning left at speed %s", speed)
 
             self._left_speed(-speed)
             self._right_speed(speed)
             self._is_moving = True
-            self._state = RobotState.SPINNING_LEFT
+            self._state = _ST_SPINNING_LEFT
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         def spin_right(
             self,
@@ -331,21 +426,19 @@ try:
         ) -> None:
             """Spin right in place by rotating motors in opposite directions."""
             self._validate_speed(speed)
-            log_msg = f"Spinning right at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("Spinning right at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("Spinning right at speed %s", speed)
 
             self._left_speed(speed)
             self._right_speed(-speed)
             self._is_moving = True
-            self._state = RobotState.SPINNING_RIGHT
+            self._state = _ST_SPINNING_RIGHT
 
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._arm_stop(seconds)
 
         # Compatibility aliases for existing code
         def left(
@@ -366,10 +459,12 @@ try:
 
         def emergency_stop(self) -> None:
             """Emergency stop - immediately halt all motors."""
+            self._cancel_stop()
             self._left_motor.throttle = MotorConfig.STOP_SPEED
             self._right_motor.throttle = MotorConfig.STOP_SPEED
+            self._last_throttle[:] = (MotorConfig.STOP_SPEED, MotorConfig.STOP_SPEED)
             self._is_moving = False
-            self._state = RobotState.EMERGENCY_STOP
+            self._state = _ST_EMERGENCY_STOP
             logger.warning("Emergency stop activated")
 
         def get_status(self) -> dict:
@@ -385,7 +480,7 @@ try:
                     "left_inverted": self._motor_config.left_motor_inverted,
                     "right_inverted": self._motor_config.right_motor_inverted,
                 },
-                "state": self._state.name,
+                "state": _STATE_NAMES[self._state],
             }
 
 
@@ -394,69 +489,95 @@ try:
             current_left = self._left_motor.throttle
             current_right = self._right_motor.throttle
 
-            # Calculate step changes based on max acceleration
-            step_left = max(
-                MotorConfig.MIN_SPEED,
-                min(MotorConfig.MAX_SPEED, target_left - current_left),
+            # Clamped once: the interpolated points then stay within range
+            target_left = max(
+                MotorConfig.MIN_SPEED, min(MotorConfig.MAX_SPEED, target_left)
             )
-            step_right = max(
-                MotorConfig.MIN_SPEED,
-                min(MotorConfig.MAX_SPEED, target_right - current_right),
+            target_right = max(
+                MotorConfig.MIN_SPEED, min(MotorConfig.MAX_SPEED, target_right)
+            )
+            delta_left = target_left - current_left
+            delta_right = target_right - current_right
+
+            # A motor whose speed does not change is not rewritten: each
+            # throttle write costs two PWM transactions on the I2C bus
+            ramp_left = abs(delta_left) >= MotorConfig.THROTTLE_DEADBAND
+            ramp_right = abs(delta_right) >= MotorConfig.THROTTLE_DEADBAND
+
+            # Whole trajectory computed up front, ending exactly on the target:
+            # the timed loop below only writes and waits
+            steps = int(MotorConfig.MAX_ACCELERATION)
+            trajectory = [
+                (current_left + delta_left * i / steps,
+                 current_right + delta_right * i / steps)
+                for i in range(1, steps + 1)
+            ]
+
+            # Steps paced against absolute deadlines so I2C time does not drift
+            interval = MotorConfig.RAMP_TIME / MotorConfig.MAX_ACCELERATION
+            deadline = time.monotonic()
+            for left, right in trajectory:
+                if ramp_left:
+                    self._left_motor.throttle = left
+                if ramp_right:
+                    self._right_motor.throttle = right
+
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+            # Throttles were written directly: resync the redundant-write filter
+            self._last_throttle[:] = (
+                self._left_motor.throttle, self._right_motor.throttle
             )
-
-            # Ramp up/down in steps
-            for _ in range(int(MotorConfig.MAX_ACCELERATION)):
-                current_left += step_left
-                current_right += step_right
-
-                # Apply constraints and set speeds
-                self._left_motor.throttle = max(
-                    MotorConfig.MIN_SPEED, min(MotorConfig.MAX_SPEED, current_left)
-                )
-                self._right_motor.throttle = max(
-                    MotorConfig.MIN_SPEED, min(MotorConfig.MAX_SPEED, current_right)
-                )
-
-                time.sleep(MotorConfig.RAMP_TIME / MotorConfig.MAX_ACCELERATION)
 
             logger.info(
-                f"Ramped to speeds - Left: {target_left}, Right: {target_right}"
+                "Ramped to speeds - Left: %s, Right: %s", target_left, target_right
             )
 
         def queue_command(self, command: MovementCommand) -> None:
             """Ajouter une commande à la queue d'exécution"""
-            self._command_queue.put(command)
+            self._command_queue.append(command)
+            self._command_event.set()
+
+        def _wait_for_stop(self) -> None:
+            """Block until the pending timed stop has fired or been cancelled.
+
+            Keeps queued timed commands sequential: the worker only takes the
+            next command once the current movement is over.
+            """
+            with self._stop_lock:
+                timer = self._stop_timer
+            if timer is not None:
+                timer.join()
 
         def _process_commands(self) -> None:
             """Traiter les commandes de manière asynchrone"""
             while self._running:
-                try:
-                    command = self._command_queue.get(timeout=1)
-                    logger.info(f"Processing command: {command}")
-                    # Execute command action
-                    if command.action == "forward":
-                        self.forward(command.speed, command.duration)
-                    elif command.action == "backward":
-                        self.backward(command.speed, command.duration)
-                    elif command.action == "turn_left":
-                        self.turn_left(command.speed, command.duration)
-                    elif command.action == "turn_right":
-                        self.turn_right(command.speed, command.duration)
-                    elif command.action == "spin_left":
-                        self.spin_left(command.speed, command.duration)
-                    elif command.action == "spin_right":
-                        self.spin_right(command.speed, command.duration)
-                    elif command.action == "stop":
-                        self.stop()
-                    else:
-                        logger.warning(f"Unknown command action: {command.action}")
-                except Exception as e:
-                    #logger.error(f"Error processing command: {e}")
-                    pass
+                self._command_event.wait()
+                # Cleared before draining: a command queued meanwhile re-arms it
+                self._command_event.clear()
+                while self._command_queue and self._running:
+                    command = self._command_queue.popleft()
+                    try:
+                        logger.info("Processing command: %s", command)
+                        # Execute command action
+                        action = self._actions.get(command.action)
+                        if action is None:
+                            logger.warning("Unknown command action: %s", command.action)
+                        else:
+                            action(command.speed, command.duration)
+                            self._wait_for_stop()
+                    except Exception as e:
+                        #logger.error(f"Error processing command: {e}")
+                        pass
 
         def shutdown(self) -> None:
             """Shutdown the robot car, stopping all motors and terminating threads."""
             self._running = False
+            self._command_event.set()  # Wake the worker so it can exit
+            self._cancel_stop()
             self.stop()
             if self._command_thread.is_alive():
                 self._command_thread.join()
@@ -464,7 +585,7 @@ try:
 
 
 except (ImportError, ValueError) as e:
-    logger.warning(f"Adafruit Crickit not available: {e}. Using dummy mode.")
+    logger.warning("Adafruit Crickit not available: %s. Using dummy mode.", e)
 
     class RobotCar:
         """Dummy implementation when hardware is not available."""
@@ -481,12 +602,14 @@ except (ImportError, ValueError) as e:
             self._dummy = True
             self._motor_config = motor_config or MotorSetup()
             self._is_moving = False
-            self._state = RobotState.STOPPED
+            self._state = _ST_STOPPED
+            self._stop_timer: Timer | None = None
+            self._stop_lock = Lock()
             logger.info("RobotCar initialized in DUMMY mode")
 
         def _validate_speed(self, speed: float, param_name: str = "speed") -> None:
             """Validate speed parameter is within valid range."""
-            if not isinstance(speed, int | float):
+            if not isinstance(speed, _NUMERIC):
                 raise TypeError(f"{param_name} must be a number")
             min_speed = MotorConfig.MIN_SPEED
             max_speed = MotorConfig.MAX_SPEED
@@ -495,20 +618,52 @@ except (ImportError, ValueError) as e:
                     f"{param_name} must be between {min_speed} and {max_speed}"
                 )
 
+        def _cancel_stop(self) -> None:
+            """Cancel any pending timed stop.
+
+            Called before the motors are written, so that a stale timer cannot
+            stop the movement that replaces the one it was armed for.
+            """
+            with self._stop_lock:
+                if self._stop_timer is not None:
+                    self._stop_timer.cancel()
+                    self._stop_timer = None
+
+        def _arm_stop(self, seconds: float | None) -> None:
+            """Arm a timed stop if seconds is given (already validated).
+
+            The stop runs on a timer thread so timed movements return at once
+            instead of blocking the caller for the whole duration.
+            """
+            if seconds is None:
+                return
+
+            def timed_stop() -> None:
+                with self._stop_lock:
+                    # Superseded by a newer movement: leave the motors alone
+                    if self._stop_timer is not timer:
+                        return
+                    self._stop_timer = None
+                    self.stop()
+
+            timer = Timer(seconds, timed_stop)
+            timer.daemon = True
+            with self._stop_lock:
+                self._stop_timer = timer
+            timer.start()
+
         def _left_speed(self, speed: float) -> None:
             """Dummy left motor control."""
-            self._validate_speed(speed)
-            logger.debug(f"DUMMY: Left motor speed would be set to {speed}")
+            logger.debug("DUMMY: Left motor speed would be set to %s", speed)
 
         def _right_speed(self, speed: float) -> None:
             """Dummy right motor control."""
-            self._validate_speed(speed)
-            logger.debug(f"DUMMY: Right motor speed would be set to {speed}")
+            logger.debug("DUMMY: Right motor speed would be set to %s", speed)
 
         def stop(self) -> None:
             """Dummy stop."""
             self._is_moving = False
-            self._state = RobotState.STOPPED
+            self._state = _ST_STOPPED
             logger.info("DUMMY: Robot stopped")
 
         def is_moving(self) -> bool:
@@ -522,17 +677,15 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy forward movement."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Moving forward at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("DUMMY: Moving forward at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("DUMMY: Moving forward at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.MOVING_FORWARD
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_MOVING_FORWARD
+            self._arm_stop(seconds)
 
         def backward(
             self,
@@ -541,25 +694,26 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy backward movement."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Moving backward at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info(
+                    "DUMMY: Moving backward at speed %s for %ss", speed, seconds
+                )
+            else:
+                logger.info("DUMMY: Moving backward at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.MOVING_BACKWARD
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_MOVING_BACKWARD
+            self._arm_stop(seconds)
 
         def steer(self, speed: float, direction: float) -> None:
             """Dummy steering."""
             self._validate_speed(speed, "speed")
             self._validate_speed(direction, "direction")
-            logger.info(f"DUMMY: Steering with speed={speed}, direction={direction}")
+            logger.info("DUMMY: Steering with speed=%s, direction=%s", speed, direction)
+            self._cancel_stop()
             self._is_moving = True
-            self._state = RobotState.STEERING
+            self._state = _ST_STEERING
 
         def turn_left(
             self,
@@ -568,17 +722,15 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy left turn."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Turning left at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("DUMMY: Turning left at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("DUMMY: Turning left at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.TURNING_LEFT
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_TURNING_LEFT
+            self._arm_stop(seconds)
 
         def turn_right(
             self,
@@ -587,17 +739,15 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy right turn."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Turning right at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("DUMMY: Turning right at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("DUMMY: Turning right at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.TURNING_RIGHT
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_TURNING_RIGHT
+            self._arm_stop(seconds)
 
         def spin_left(
             self,
@@ -606,17 +756,15 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy spin left."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Spinning left at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("DUMMY: Spinning left at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("DUMMY: Spinning left at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.SPINNING_LEFT
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_SPINNING_LEFT
+            self._arm_stop(seconds)
 
         def spin_right(
             self,
@@ -625,17 +773,15 @@ except (ImportError, ValueError) as e:
         ) -> None:
             """Dummy spin right."""
             self._validate_speed(speed)
-            log_msg = f"DUMMY: Spinning right at speed {speed}"
+            _validate_seconds(seconds)
+            self._cancel_stop()
             if seconds:
-                log_msg += f" for {seconds}s"
-            logger.info(log_msg)
+                logger.info("DUMMY: Spinning right at speed %s for %ss", speed, seconds)
+            else:
+                logger.info("DUMMY: Spinning right at speed %s", speed)
             self._is_moving = True
-            self._state = RobotState.SPINNING_RIGHT
-            if seconds is not None:
-                if seconds < 0:
-                    raise ValueError("seconds must be non-negative")
-                time.sleep(seconds)
-                self.stop()
+            self._state = _ST_SPINNING_RIGHT
+            self._arm_stop(seconds)
 
         # Compatibility aliases
         def left(
@@ -656,8 +802,9 @@ except (ImportError, ValueError) as e:
 
         def emergency_stop(self) -> None:
             """Dummy emergency stop."""
+            self._cancel_stop()
             self._is_moving = False
-            self._state = RobotState.EMERGENCY_STOP
+            self._state = _ST_EMERGENCY_STOP
             logger.warning("DUMMY: Emergency stop activated")
 
         def get_status(self) -> dict:
@@ -673,5 +820,5 @@ except (ImportError, ValueError) as e:
                     "left_inverted": self._motor_config.left_motor_inverted,
                     "right_inverted": self._motor_config.right_motor_inverted,
                 },
-                "state": self._state.name,
+                "state": _STATE_NAMES[self._state],
             }
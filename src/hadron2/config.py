@@ -3,8 +3,26 @@ Configuration centralisée pour l'application robot.
 Contient tous les paramètres configurables pour une maintenance facile.
 """
 
+import os
 from dataclasses import dataclass
 
+# Qualité JPEG du flux vidéo, réglable sans modifier le code (HADRON_JPEG_Q).
+# Vers 60 les frames restent petites pour un rendu suffisant sur un aperçu
+# de pilotage.
+DEFAULT_JPEG_QUALITY = 60
+
+
+def _env_jpeg_quality() -> int:
+    """Lit HADRON_JPEG_Q, bornée à 1-100 ; valeur par défaut si invalide"""
+    try:
+        quality = int(os.environ.get("HADRON_JPEG_Q", DEFAULT_JPEG_QUALITY))
+    except ValueError:
+        return DEFAULT_JPEG_QUALITY
+    return max(1, min(100, quality))
+
+
+JPEG_QUALITY = _env_jpeg_quality()
+
 
 @dataclass
 class CameraConfig:
@@ -12,11 +30,29 @@ class CameraConfig:
     width: int = 640
     height: int = 480
     fps: int = 30
-    buffer_size: int = 1  # Buffer minimal pour réduire la latence
+    # Tampons libcamera : avec un seul, le capteur attend que l'encoder ait
+    # rendu le sien ; quelques tampons absorbent la gigue sans ajouter de
+    # latence (les frames sont consommées dès qu'elles sont prêtes)
+    buffer_size: int = 6
     device_index: int = 0
-    quality: int = 85  # Qualité JPEG (0-100)
+    quality: int = JPEG_QUALITY  # Qualité JPEG (0-100)
     vflip: int = 1  # Vertical flip
     hflip: int = 1  # Horizontal flip
+    encoder_cpus: tuple[int, ...] = (3,)  # Cœurs dédiés à l'encodage
+    
+    # Suspend caméra et encodage sans client du flux (économie de batterie ;
+    # la capture MCP n'a alors plus de frame récente)
+    stop_when_idle: bool = False
+    idle_grace: float = 5.0  # Délai avant suspension (s), évite les à-coups
+    
+    # Encodage MJPEG matériel (V4L2, Pi 4 et antérieurs) au lieu de libjpeg
+    mjpeg_hardware: bool = False
+    mjpeg_bitrate: int = 8_000_000  # bits/s, remplace quality en matériel
+    
+    # Flux H.264 matériel en plus du MJPEG (/video_feed_h264)
+    h264_enabled: bool = False
+    h264_bitrate: int = 1_000_000  # bits/s
+    h264_iperiod: int = 15  # Frames entre deux images clés
     
 
 
@@ -36,6 +72,7 @@ class RobotConfig:
     turn_speed: float = 0.8
     acceleration: float = 0.1
     deceleration: float = 0.2
+    speed_deadband: float = 0.02  # Variation ignorée pour une même commande
     
     # Commandes (rétrocompatibilité)
     cmd_forward: str = "forward"
@@ -53,6 +90,8 @@ class JoystickConfig:
     axis_x: int = 0  # Axe horizontal (gauche/droite)
     axis_y: int = 1  # Axe vertical (avant/arrière)
     button_stop: int = 0  # Bouton d'arrêt d'urgence
+    cpus: tuple[int, ...] = (0,)  # Cœurs dédiés à la lecture de la manette
+    realtime_priority: int = 10  # SCHED_FIFO (0 = désactivé, CAP_SYS_NICE requis)
 
 
 @dataclass
@@ -62,7 +101,9 @@ class WebConfig:
     port: int = 8080
     video_port: int = 8081
     websocket_port: int = 8082
-    websocket_frequency: int = 200  # Hz - Haute fréquence pour faible latence
+    status_broadcast_frequency: int = 20  # Hz - Diffusion des états aux clients
+    video_send_buffer: int = 32768  # SO_SNDBUF du flux vidéo (octets)
+    server_cpus: tuple[int, ...] = (1, 2)  # Cœurs des serveurs HTTP (hors manette)
     
     # CORS
     cors_origins: list = None
@@ -115,15 +156,15 @@ def configure_for_development():
     config.debug = True
     config.log_level = "DEBUG"
     config.camera.quality = 70  # Qualité réduite pour le dev
-    config.web.websocket_frequency = 100  # Fréquence réduite
+    config.web.status_broadcast_frequency = 10  # Fréquence réduite
 
 
 def configure_for_production():
     """Configuration optimisée pour la production"""
     config.debug = False
     config.log_level = "INFO"
-    config.camera.quality = 85
-    config.web.websocket_frequency = 200  # Haute fréquence
+    config.camera.quality = JPEG_QUALITY
+    config.web.status_broadcast_frequency = 20
 
 
 def configure_for_testing():
@@ -3,52 +3,214 @@ Service de gestion de la caméra.
 Optimisé pour une latence minimale avec buffer réduit.
 """
 
+import asyncio
+import contextlib
+import io
 import logging
-import queue
 import threading
 import time
-from collections.abc import Callable, Generator
-import io
-
-import cv2
-import libcamera
-from libcamera import controls
-from picamera2 import Picamera2
-from picamera2.encoders import JpegEncoder, MJPEGEncoder
-from picamera2.outputs import FileOutput
+from collections.abc import AsyncGenerator, Callable, Generator
+from typing import TYPE_CHECKING
 
 from config import config
 
+from core.realtime import pin_thread
+
+if TYPE_CHECKING:
+    from picamera2 import Picamera2
+
+
+class FrameRing:
+    """
+    Tampon circulaire sans verrou (un producteur, N lecteurs) pour les frames JPEG.
+    
+    Le producteur écrit le slot puis avance ``head`` ; chaque lecteur garde son
+    propre curseur. Sous le GIL, l'affectation d'une référence ou d'un entier
+    est atomique : le slot est toujours visible avant le nouvel index.
+    """
+    
+    def __init__(self, size: int = 8):
+        if size <= 0 or size & (size - 1):
+            raise ValueError("La taille du tampon doit être une puissance de deux")
+        self._slots: list[bytes | None] = [None] * size
+        self._mask = size - 1
+        self.head = 0
+    
+    def publish(self, frame: bytes):
+        """Publie une nouvelle frame (appelé uniquement par le producteur)"""
+        head = self.head
+        self._slots[head & self._mask] = frame
+        self.head = head + 1
+    
+    def read(self, tail: int) -> tuple[bytes | None, int]:
+        """
+        Lit la frame suivante pour un curseur donné
+        
+        Un lecteur en retard saute directement à la frame la plus récente :
+        un client lent ne bloque jamais le producteur.
+        
+        Returns:
+            (frame ou None si rien de nouveau, nouveau curseur)
+        """
+        head = self.head
+        if tail >= head:
+            return None, tail
+        if head - tail > 1:
+            tail = head - 1
+        return self._slots[tail & self._mask], tail + 1
+    
+    def latest(self) -> bytes | None:
+        """Retourne la frame la plus récente sans déplacer de curseur"""
+        head = self.head
+        return self._slots[(head - 1) & self._mask] if head else None
+    
+    def clear(self):
+        """Oublie les frames publiées (les curseurs restent valides)"""
+        self._slots = [None] * len(self._slots)
+
 
 class StreamingOutput(io.BufferedIOBase):
     """Sortie de streaming compatible avec picamera2"""
     
-    def __init__(self):
-        self.frame = None
-        self.condition = threading.Condition()
+    # Une frame identique est tout de même republiée après ce délai (s)
+    # pour que les clients reçoivent un signe de vie
+    DUPLICATE_KEEPALIVE = 1.0
+    
+    def __init__(self, ring_size: int = 8, skip_duplicates: bool = False):
+        self.ring = FrameRing(ring_size)
+        # Ignore les frames identiques à la précédente (scène immobile) ;
+        # réservé aux formats sans dépendance entre frames (JPEG)
+        self.skip_duplicates = skip_duplicates
+        self._last_publish = 0.0
+        # Événements à réveiller à chaque frame (copie à l'écriture) ;
+        # boucle None pour un threading.Event. Le verrou ne sérialise que
+        # les ajouts/retraits : write() lit le tuple sans le prendre.
+        self._listeners_lock = threading.Lock()
+        self._listeners: tuple[
+            tuple[
+                asyncio.AbstractEventLoop | None, asyncio.Event | threading.Event
+            ],
+            ...,
+        ] = ()
+    
+    @property
+    def frame(self) -> bytes | None:
+        return self.ring.latest()
+    
+    def add_listener(
+        self,
+        loop: asyncio.AbstractEventLoop | None,
+        event: asyncio.Event | threading.Event
+    ):
+        """
+        Enregistre un événement signalé à chaque nouvelle frame
+        
+        Args:
+            loop: Boucle de l'événement asyncio, None pour un threading.Event
+            event: Événement à signaler
+        """
+        with self._listeners_lock:
+            self._listeners = self._listeners + ((loop, event),)
+    
+    def remove_listener(self, event: asyncio.Event | threading.Event):
+        """Retire un événement précédemment enregistré"""
+        with self._listeners_lock:
+            self._listeners = tuple(
+                (loop, ev) for loop, ev in self._listeners if ev is not event
+            )
     
     def write(self, buf):
-        # Cette méthode est appelée par l'encoder
-        with self.condition:
-            self.frame = buf
-            self.condition.notify_all()
+        # Cette méthode est appelée par l'encoder : publication sans verrou.
+        # Un bytes est immuable et publié tel quel ; seul un tampon que
+        # l'encoder peut réutiliser (memoryview sur mmap, bytearray) est copié.
+        if self.skip_duplicates:
+            now = time.monotonic()
+            if (now - self._last_publish < self.DUPLICATE_KEEPALIVE
+                    and buf == self.ring.latest()):
+                return len(buf)
+            self._last_publish = now
+        if not isinstance(buf, bytes):
+            buf = bytes(buf)
+        self.ring.publish(buf)
+        for loop, event in self._listeners:
+            if loop is None:
+                event.set()
+                continue
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Boucle fermée : le client ne sera plus servi
+                self.remove_listener(event)
         return len(buf)
 
     def flush(self):
         pass
 
 
+def is_h264_keyframe(frame: bytes) -> bool:
+    """
+    Indique si une sortie de l'encoder H.264 commence par un SPS
+    
+    Avec ``repeat=True`` l'encoder répète SPS/PPS devant chaque image clé :
+    un décodeur peut démarrer sur une telle frame.
+    """
+    start = frame.find(b"\x00\x00\x01", 0, 8)
+    return start >= 0 and len(frame) > start + 3 and frame[start + 3] & 0x1F == 7
+
+
+class FrameBroadcaster:
+    """
+    Diffuse les frames d'une sortie à tous les clients d'une boucle asyncio
+    
+    Une seule tâche lit la sortie et dépose chaque frame dans une file d'un
+    élément par client (la frame la plus récente remplace l'ancienne) : le
+    travail côté encoder ne dépend pas du nombre de clients.
+    """
+    
+    def __init__(self, service: "CameraService", output: StreamingOutput):
+        self._service = service
+        self._output = output
+        self._queues: set[asyncio.Queue] = set()
+        self._task: asyncio.Task | None = None
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Enregistre un client et démarre la diffusion si nécessaire"""
+        queue = asyncio.Queue(maxsize=1)
+        self._queues.add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._pump())
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Retire un client et arrête la diffusion s'il était le dernier"""
+        self._queues.discard(queue)
+        if not self._queues and self._task:
+            self._task.cancel()
+            self._task = None
+    
+    async def _pump(self):
+        """Tâche unique de lecture de la sortie"""
+        async for item in self._service._follow_output(self._output):
+            for queue in self._queues:
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(item)
+
+
 class CameraService:
     """Service de capture vidéo optimisé pour la latence minimale"""
     
     def __init__(self):
         self.camera: Picamera2 | None = None
         self.is_running = False
-        self.output = StreamingOutput()
-        self.frame_queue = queue.Queue(maxsize=1)  # Buffer minimal
+        self.output = StreamingOutput(skip_duplicates=True)
+        self.h264_output: StreamingOutput | None = None
+        self.mjpeg_broadcaster = FrameBroadcaster(self, self.output)
+        self.h264_broadcaster: FrameBroadcaster | None = None
         self.capture_thread: threading.Thread | None = None
         self.logger = logging.getLogger(__name__)
         self.encoder = None
+        self.h264_encoder = None
         
         # Statistiques
         self.frames_captured = 0
@@ -56,6 +218,13 @@ class CameraService:
         self.last_fps_time = time.time()
         self.current_fps = 0.0
         
+        # Clients du flux ; l'encodage est suspendu sans client si
+        # config.camera.stop_when_idle (signalé tant qu'un client est connecté)
+        self._stream_clients = 0
+        self._clients_lock = threading.Lock()
+        self._clients_present = threading.Event()
+        self._last_client_left = 0.0
+        
         # Callbacks
         self._frame_callbacks = []
         
@@ -68,31 +237,53 @@ class CameraService:
                 self.logger.info("Mode test: caméra désactivée")
                 return
             
+            # Import différé : la pile libcamera/picamera2 (plusieurs dizaines
+            # de Mo) n'est chargée que si une caméra est réellement utilisée
+            import libcamera
+            from picamera2 import Picamera2
+            from picamera2.encoders import H264Encoder, JpegEncoder, MJPEGEncoder
+            
             self.camera = Picamera2()
             
             # Configuration de la caméra
             video_config = self.camera.create_video_configuration(
                 main={
                     "size": (config.camera.width, config.camera.height),
-                    "format": "RGB888"
+                    # Format natif de l'ISP, accepté tel quel par les encoders
+                    # JPEG et H.264 : moitié moins d'octets par frame qu'en RGB
+                    "format": "YUV420"
                 },
                 buffer_count=config.camera.buffer_size,
+                # Transformation (flip) et cadence fixées dans la configuration :
+                # aucun set_controls supplémentaire après configure()
+                transform=libcamera.Transform(
+                    hflip=config.camera.hflip,
+                    vflip=config.camera.vflip
+                ),
                 controls={
-                    "FrameRate": config.camera.fps,
+                    # FrameRate n'est qu'un alias de FrameDurationLimits
                     "FrameDurationLimits": (int(1000000/config.camera.fps), int(1000000/config.camera.fps))
                 }
             )
             
-            # Application de la transformation (flip)
-            video_config["transform"] = libcamera.Transform(
-                hflip=config.camera.hflip, 
-                vflip=config.camera.vflip
-            )
-            
             self.camera.configure(video_config)
             
-            # Créer l'encoder JPEG
-            self.encoder = JpegEncoder(q=config.camera.quality)
+            # Créer l'encoder JPEG : matériel (libère un cœur, sorties dans des
+            # tampons mmap réutilisés, donc copiés par StreamingOutput) ou logiciel
+            if config.camera.mjpeg_hardware:
+                self.encoder = MJPEGEncoder(bitrate=config.camera.mjpeg_bitrate)
+            else:
+                self.encoder = JpegEncoder(q=config.camera.quality)
+            
+            # Encoder H.264 matériel optionnel, en parallèle du MJPEG
+            if config.camera.h264_enabled:
+                self.h264_encoder = H264Encoder(
+                    bitrate=config.camera.h264_bitrate,
+                    repeat=True,
+                    iperiod=config.camera.h264_iperiod
+                )
+                self.h264_output = StreamingOutput()
+                self.h264_broadcaster = FrameBroadcaster(self, self.h264_output)
                 
             self.logger.info(f"Caméra initialisée: {config.camera.width}x{config.camera.height} @ {config.camera.fps}fps")
             
@@ -112,70 +303,100 @@ class CameraService:
             except Exception as e:
                 self.logger.error(f"Erreur dans le callback de frame: {e}")
     
+    def _client_connected(self):
+        """Compte un client du flux et relance l'encodage si nécessaire"""
+        with self._clients_lock:
+            self._stream_clients += 1
+            self._clients_present.set()
+    
+    def _client_disconnected(self):
+        """Décompte un client du flux"""
+        with self._clients_lock:
+            self._stream_clients -= 1
+            if self._stream_clients == 0:
+                self._clients_present.clear()
+                self._last_client_left = time.monotonic()
+    
+    def _should_idle(self) -> bool:
+        """Indique si l'encodage peut être suspendu faute de client"""
+        return (
+            config.camera.stop_when_idle
+            and not self._clients_present.is_set()
+            and time.monotonic() - self._last_client_left > config.camera.idle_grace
+        )
+    
+    def _start_recording(self):
+        """Démarre les encoders et épingle leurs threads"""
+        from picamera2.outputs import FileOutput
+        
+        threads_before = set(threading.enumerate())
+        self.camera.start_recording(self.encoder, FileOutput(self.output))
+        if self.h264_encoder:
+            self.camera.start_encoder(self.h264_encoder, FileOutput(self.h264_output))
+        self.logger.info("Démarrage de la capture vidéo")
+        
+        # Épingle les threads créés par l'encoder et ce thread de capture
+        pin_thread(config.camera.encoder_cpus)
+        for thread in set(threading.enumerate()) - threads_before:
+            if thread.native_id is not None:
+                pin_thread(config.camera.encoder_cpus, thread.native_id)
+    
     def _capture_frames(self):
         """Thread de capture des frames en continu"""
-        frame_count = 0
-        fps_start_time = time.time()
-        
-        try:
-            # Démarrer l'enregistrement avec l'encoder et l'output
-            self.camera.start_recording(self.encoder, FileOutput(self.output))
-            self.logger.info("Démarrage de la capture vidéo")
+        while self.is_running and self.camera:
+            # Aucun client : caméra et encoder à l'arrêt jusqu'au prochain
+            if config.camera.stop_when_idle and not self._clients_present.wait(1.0):
+                continue
             
-            while self.is_running and self.camera:
-                try:
-                    # Attendre une nouvelle frame
-                    with self.output.condition:
-                        if self.output.condition.wait(timeout=1.0):
-                            if self.output.frame is not None:
-                                frame_bytes = self.output.frame
-                                
-                                # Met à jour la queue (supprime l'ancienne frame si pleine)
-                                try:
-                                    self.frame_queue.put_nowait(frame_bytes)
-                                    self.frames_captured += 1
-                                except queue.Full:
-                                    # Supprime l'ancienne frame et ajoute la nouvelle
-                                    try:
-                                        self.frame_queue.get_nowait()
-                                        self.frames_dropped += 1
-                                    except queue.Empty:
-                                        pass
-                                    
-                                    try:
-                                        self.frame_queue.put_nowait(frame_bytes)
-                                        self.frames_captured += 1
-                                    except queue.Full:
-                                        pass
-                                
-                                # Notifie les callbacks
-                                self._notify_frame_callbacks(frame_bytes)
-                                
-                                # Calcule le FPS
-                                frame_count += 1
-                                if frame_count % 30 == 0:  # Calcule le FPS toutes les 30 frames
-                                    current_time = time.time()
-                                    elapsed = current_time - fps_start_time
-                                    if elapsed > 0:
-                                        self.current_fps = 30 / elapsed
-                                    fps_start_time = current_time
-                        else:
-                            # Timeout - pas de nouvelle frame
-                            time.sleep(0.01)
-                            
-                except Exception as e:
-                    self.logger.error(f"Erreur dans la capture de frame: {e}")
-                    time.sleep(0.01)
-                    
-        except Exception as e:
-            self.logger.error(f"Erreur lors du démarrage de l'enregistrement: {e}")
-        finally:
-            # Arrêter l'enregistrement
-            if self.camera:
+            try:
+                self._start_recording()
+            except Exception as e:
+                self.logger.error(f"Erreur lors du démarrage de l'enregistrement: {e}")
+                return
+            
+            try:
+                self._process_frames()
+            finally:
+                # Arrêter l'enregistrement
                 try:
                     self.camera.stop_recording()
                 except:
                     pass
+            
+            if self.is_running:
+                self.logger.info("Aucun client : capture vidéo suspendue")
+    
+    def _process_frames(self):
+        """Traite les frames publiées jusqu'à l'arrêt ou la suspension"""
+        frame_count = 0
+        fps_start_time = time.time()
+        last_seq = None
+        
+        for frame_bytes, seq in self._follow_output_sync(self.output):
+            if not self.camera or self._should_idle():
+                break
+            try:
+                # Frames écrasées avant d'avoir été lues
+                if last_seq is not None:
+                    self.frames_dropped += seq - last_seq - 1
+                self.frames_captured += 1
+                last_seq = seq
+                
+                # Notifie les callbacks
+                self._notify_frame_callbacks(frame_bytes)
+                
+                # Calcule le FPS
+                frame_count += 1
+                if frame_count % 30 == 0:  # Calcule le FPS toutes les 30 frames
+                    current_time = time.time()
+                    elapsed = current_time - fps_start_time
+                    if elapsed > 0:
+                        self.current_fps = 30 / elapsed
+                    fps_start_time = current_time
+                        
+            except Exception as e:
+                self.logger.error(f"Erreur dans la capture de frame: {e}")
+                time.sleep(0.01)
     
     def start_capture(self) -> bool:
         """Démarre la capture vidéo"""
@@ -204,30 +425,124 @@ class CameraService:
         if self.capture_thread:
             self.capture_thread.join(timeout=2.0)
         
-        # Vide la queue
-        while not self.frame_queue.empty():
-            try:
-                self.frame_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Oublie les frames en attente
+        self.output.ring.clear()
         
         self.logger.info("Capture vidéo arrêtée")
     
     def get_latest_frame(self) -> bytes | None:
         """Récupère la dernière frame disponible"""
-        try:
-            return self.frame_queue.get_nowait()
-        except queue.Empty:
-            return None
+        return self.output.ring.latest()
     
     def frame_generator(self) -> Generator[bytes, None, None]:
-        """Générateur de frames pour le streaming"""
-        while self.is_running:
-            frame_data = self.get_latest_frame()
-            if frame_data:
+        """
+        Générateur de frames pour le streaming (un curseur par client)
+        
+        Seule la frame la plus récente est servie : un client lent saute
+        les frames intermédiaires au lieu d'accumuler du retard.
+        """
+        self._client_connected()
+        try:
+            for frame_data, _ in self._follow_output_sync(self.output):
                 yield frame_data
-            else:
-                time.sleep(0.001)  # Pause courte si pas de frame
+        finally:
+            self._client_disconnected()
+    
+    def _follow_output_sync(
+        self, output: StreamingOutput
+    ) -> Generator[tuple[bytes, int], None, None]:
+        """
+        Suit les frames publiées sur une sortie depuis un thread
+        
+        Attend un threading.Event signalé par l'encoder au lieu de sonder.
+        
+        Yields:
+            (frame, numéro de séquence de la frame)
+        """
+        ring = output.ring
+        event = threading.Event()
+        output.add_listener(None, event)
+        tail = ring.head
+        try:
+            while self.is_running:
+                frame_data, tail = ring.read(tail)
+                if frame_data:
+                    yield frame_data, tail
+                    continue
+                
+                # Délai pour revérifier périodiquement l'état de la capture
+                event.wait(1.0)
+                event.clear()
+        finally:
+            output.remove_listener(event)
+    
+    async def _follow_output(
+        self, output: StreamingOutput
+    ) -> AsyncGenerator[tuple[bytes, int], None]:
+        """
+        Suit les frames publiées sur une sortie, sans thread dédié
+        
+        Attend un événement asyncio signalé par l'encoder.
+        
+        Yields:
+            (frame, numéro de séquence de la frame)
+        """
+        ring = output.ring
+        event = asyncio.Event()
+        output.add_listener(asyncio.get_running_loop(), event)
+        tail = ring.head
+        try:
+            while self.is_running:
+                frame_data, tail = ring.read(tail)
+                if frame_data:
+                    yield frame_data, tail
+                    continue
+                
+                event.clear()
+                # Délai pour revérifier périodiquement l'état de la capture
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(event.wait(), timeout=1.0)
+        finally:
+            output.remove_listener(event)
+    
+    async def _subscribe(
+        self, broadcaster: "FrameBroadcaster"
+    ) -> AsyncGenerator[tuple[bytes, int], None]:
+        """Reçoit les frames d'un diffuseur tant que la capture tourne"""
+        queue = broadcaster.subscribe()
+        self._client_connected()
+        try:
+            while self.is_running:
+                # Délai pour revérifier périodiquement l'état de la capture
+                with contextlib.suppress(TimeoutError):
+                    yield await asyncio.wait_for(queue.get(), timeout=1.0)
+        finally:
+            self._client_disconnected()
+            broadcaster.unsubscribe(queue)
+    
+    async def async_frame_generator(self) -> AsyncGenerator[bytes, None]:
+        """Générateur asynchrone de frames JPEG pour le streaming"""
+        async for frame_data, _ in self._subscribe(self.mjpeg_broadcaster):
+            yield frame_data
+    
+    async def async_h264_generator(self) -> AsyncGenerator[bytes, None]:
+        """
+        Générateur asynchrone du flux H.264 (Annex-B)
+        
+        Contrairement au MJPEG, les frames dépendent des précédentes : un
+        client qui démarre ou qui a pris du retard attend la prochaine
+        image clé au lieu de recevoir un flux indécodable.
+        """
+        if not self.h264_broadcaster:
+            return
+        
+        last_seq = None
+        async for frame_data, seq in self._subscribe(self.h264_broadcaster):
+            in_sequence = last_seq is not None and seq == last_seq + 1
+            if not in_sequence and not is_h264_keyframe(frame_data):
+                continue
+            last_seq = seq
+            yield frame_data
     
     def get_stats(self) -> dict:
         """Retourne les statistiques de capture"""
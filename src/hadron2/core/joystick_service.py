@@ -10,6 +10,8 @@ from collections.abc import Callable
 from config import config
 from joystickController import EventType, JoystickConfig, JoystickReader
 
+from core.realtime import pin_thread, set_realtime_priority
+
 
 class JoystickService:
     """Service de gestion de la manette avec callbacks vers le robot"""
@@ -28,6 +30,13 @@ class JoystickService:
         # État actuel
         self.current_axes = {"x": 0.0, "y": 0.0}
         self.current_buttons = {}
+        # Axes modifiés depuis le dernier lot d'événements
+        self._axes_changed = False
+        # Numéro d'axe vers clé de current_axes (résolu une fois)
+        self._axis_keys = {
+            config.joystick.axis_x: "x",
+            config.joystick.axis_y: "y"
+        }
         
         self._initialize_joystick()
     
@@ -61,22 +70,34 @@ class JoystickService:
         
         # Callback pour les boutons
         self.joystick.add_callback(EventType.BUTTON, self._on_button_event)
+        
+        # Mouvement transmis une fois par lot d'événements
+        self.joystick.add_batch_callback(self._on_batch_end)
     
     def _on_axis_event(self, event):
         """Gestionnaire des événements d'axe"""
         try:
-            axis = event.number
+            # Met à jour l'état des axes
+            key = self._axis_keys.get(event.number)
             value = event.normalized_value
             
-            # Met à jour l'état des axes
-            if axis == config.joystick.axis_x:
-                self.current_axes["x"] = value
-            elif axis == config.joystick.axis_y:
-                self.current_axes["y"] = value
+            # Valeur inchangée : rien à transmettre au robot
+            if key is not None and self.current_axes[key] != value:
+                self.current_axes[key] = value
+                self._axes_changed = True
             
+        except Exception as e:
+            self.logger.error(f"Erreur dans le gestionnaire d'axe: {e}")
+    
+    def _on_batch_end(self):
+        """Transmet l'état final des axes après une rafale d'événements"""
+        if not self._axes_changed:
+            return
+        self._axes_changed = False
+        
+        try:
             # Appelle le callback de mouvement si configuré
-            if (self._movement_callback and 
-                axis in [config.joystick.axis_x, config.joystick.axis_y]):
+            if self._movement_callback:
                 self._movement_callback(
                     self.current_axes["x"],
                     self.current_axes["y"]
@@ -86,7 +107,7 @@ class JoystickService:
             self._notify_state_change()
             
         except Exception as e:
-            self.logger.error(f"Erreur dans le gestionnaire d'axe: {e}")
+            self.logger.error(f"Erreur lors de la transmission du mouvement: {e}")
     
     def _on_button_event(self, event):
         """Gestionnaire des événements de bouton"""
@@ -179,6 +200,10 @@ class JoystickService:
         if not self.joystick:
             return
         
+        # Cœur dédié et priorité temps réel pour limiter la gigue de commande
+        pin_thread(config.joystick.cpus)
+        set_realtime_priority(config.joystick.realtime_priority)
+        
         try:
             # Utilise la nouvelle API avec read_events() dans un générateur
             for _ in self.joystick.read_events():
@@ -0,0 +1,70 @@
+"""
+Ordonnancement des threads sensibles à la latence.
+Épingle les threads sur des cœurs dédiés et relève leur priorité (Linux).
+"""
+
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+try:
+    import uvloop
+    run_loop = uvloop.run
+except ImportError:
+    # uvloop absent (hors Raspberry Pi) : boucle asyncio standard
+    run_loop = asyncio.run
+
+
+def pin_thread(cpus: tuple[int, ...], thread_id: int = 0) -> bool:
+    """
+    Épingle un thread sur les cœurs donnés
+
+    Args:
+        cpus: Cœurs autorisés (ignoré si vide)
+        thread_id: Identifiant natif du thread (0 = thread courant)
+
+    Returns:
+        True si l'affinité a été appliquée
+    """
+    if not cpus or not hasattr(os, "sched_setaffinity"):
+        return False
+
+    # Ignore les cœurs absents (ex: Pi avec moins de 4 cœurs)
+    allowed = set(cpus) & set(range(os.cpu_count() or 1))
+    if not allowed:
+        logger.warning("Aucun des cœurs %s n'est disponible", cpus)
+        return False
+
+    try:
+        os.sched_setaffinity(thread_id, allowed)
+        return True
+    except OSError as e:
+        logger.warning("Impossible d'épingler le thread %s: %s", thread_id, e)
+        return False
+
+
+def set_realtime_priority(priority: int, thread_id: int = 0) -> bool:
+    """
+    Passe un thread en SCHED_FIFO avec la priorité donnée
+
+    Nécessite CAP_SYS_NICE (ou root) ; en cas d'échec le thread garde
+    l'ordonnancement par défaut.
+
+    Args:
+        priority: Priorité temps réel (0 = désactivé)
+        thread_id: Identifiant natif du thread (0 = thread courant)
+
+    Returns:
+        True si la priorité a été appliquée
+    """
+    if priority <= 0 or not hasattr(os, "sched_setscheduler"):
+        return False
+
+    try:
+        os.sched_setscheduler(thread_id, os.SCHED_FIFO, os.sched_param(priority))
+        return True
+    except OSError as e:
+        logger.warning("Priorité temps réel refusée (CAP_SYS_NICE requis?): %s", e)
+        return False
@@ -6,9 +6,9 @@ Encapsule toute la logique de contrôle des moteurs et mouvements.
 import logging
 import time
 from collections.abc import Callable
-from threading import Lock
+from threading import Event, Lock, Thread, Timer
 
-from carController import RobotCar
+from carController import MotorConfig, RobotCar
 from config import config
 
 
@@ -21,8 +21,24 @@ class RobotService:
         self.current_speed = 0.0
         self._lock = Lock()
         self._state_callbacks = []
+        # Numéro de l'état : une notification plus ancienne que la dernière
+        # diffusée est abandonnée, les clients finissent sur l'état courant
+        self._state_seq = 0
+        self._notified_seq = 0
+        self._notify_lock = Lock()
+        self._commands: dict[str, Callable[[float], None]] = {}
         self.logger = logging.getLogger(__name__)
         
+        # Boîte aux lettres du thread moteur : seule la dernière consigne
+        # compte, les producteurs (manette, HTTP, WebSocket, MCP) l'écrasent
+        self._target: tuple[str, float] | None = None
+        self._target_event = Event()
+        self._motor_thread: Thread | None = None
+        
+        # Arrêt programmé par une commande à durée : toute commande acceptée
+        # ensuite le remplace, sinon il couperait le mouvement suivant
+        self._stop_timer: Timer | None = None
+        
         # État du robot
         self.is_moving = False
         self.last_command_time = time.time()
@@ -47,23 +63,60 @@ class RobotService:
                 stop_at_exit=True,
                 motor_config=motor_config
             )
+            self._commands = self._build_command_table(self.robot)
+            self._motor_thread = Thread(
+                target=self._motor_loop, daemon=True, name="RobotService-motor"
+            )
+            self._motor_thread.start()
             self.logger.info("Robot initialisé avec succès")
         except Exception as e:
             self.logger.error(f"Erreur lors de l'initialisation du robot: {e}")
             self.robot = None
     
+    @staticmethod
+    def _build_command_table(robot: RobotCar) -> dict[str, Callable[[float], None]]:
+        """Associe chaque commande configurée à la méthode du robot"""
+        return {
+            config.robot.cmd_forward: robot.forward,
+            config.robot.cmd_backward: robot.backward,
+            config.robot.cmd_left: robot.turn_left,
+            config.robot.cmd_right: robot.turn_right,
+            config.robot.cmd_stop: lambda speed: robot.stop(),
+        }
+    
+    def _motor_loop(self):
+        """
+        Seul écrivain des moteurs : applique la dernière consigne publiée
+        
+        Les rafales de commandes sont fusionnées et les appelants (dont la
+        boucle asyncio des serveurs) n'attendent jamais le bus I2C.
+        """
+        while True:
+            self._target_event.wait()
+            self._target_event.clear()
+            command, speed = self._target
+            try:
+                self._commands[command](speed)
+            except Exception as e:
+                self.logger.error(
+                    f"Erreur lors de l'exécution de la commande {command}: {e}"
+                )
+    
     def add_state_callback(self, callback: Callable[[dict], None]):
         """Ajoute un callback appelé lors des changements d'état"""
         self._state_callbacks.append(callback)
     
-    def _notify_state_change(self):
+    def _notify_state_change(self, state: dict, seq: int):
         """Notifie tous les callbacks des changements d'état"""
-        state = self.get_state()
-        for callback in self._state_callbacks:
-            try:
-                callback(state)
-            except Exception as e:
-                self.logger.error(f"Erreur dans le callback d'état: {e}")
+        with self._notify_lock:
+            if seq < self._notified_seq:
+                return
+            self._notified_seq = seq
+            for callback in self._state_callbacks:
+                try:
+                    callback(state)
+                except Exception as e:
+                    self.logger.error(f"Erreur dans le callback d'état: {e}")
     
     def get_state(self) -> dict:
         """Retourne l'état actuel du robot"""
@@ -75,17 +128,34 @@ class RobotService:
             "last_command_time": self.last_command_time
         }
     
-    def execute_command(self, command: str, speed: float = None) -> bool:
+    def execute_command(
+        self, command: str, speed: float = None, duration: float | None = None
+    ) -> bool:
         """
         Exécute une commande de mouvement
         
         Args:
             command: Commande (forward, backward, left, right, stop)
             speed: Vitesse optionnelle (0.0 à 1.0)
+            duration: Durée en secondes avant l'arrêt automatique (optionnel)
         
         Returns:
-            True si la commande a été exécutée avec succès
+            True si la commande a été acceptée (appliquée par le thread moteur)
         """
+        return self._execute(command, speed, duration, None)
+    
+    def _timed_stop(self, timer: Timer):
+        """Arrêt programmé, ignoré si une commande plus récente l'a remplacé"""
+        self._execute(config.robot.cmd_stop, None, None, timer)
+    
+    def _execute(
+        self,
+        command: str,
+        speed: float | None,
+        duration: float | None,
+        timer: Timer | None,
+    ) -> bool:
+        """Corps d'execute_command ; timer est l'arrêt programmé appelant"""
         if not self.robot:
             self.logger.warning("Robot non initialisé")
             return False
@@ -99,21 +169,39 @@ class RobotService:
                     else:
                         speed = config.robot.max_speed
                 
-                # Exécute la commande
-                if command == config.robot.cmd_forward:
-                    self.robot.forward(speed)
-                elif command == config.robot.cmd_backward:
-                    self.robot.backward(speed)
-                elif command == config.robot.cmd_left:
-                    self.robot.turn_left(speed)
-                elif command == config.robot.cmd_right:
-                    self.robot.turn_right(speed)
-                elif command == config.robot.cmd_stop:
-                    self.robot.stop()
-                    speed = 0.0
-                else:
+                if command not in self._commands:
                     self.logger.warning(f"Commande inconnue: {command}")
                     return False
+                # Validée ici : le thread moteur ne peut plus renvoyer d'erreur
+                if not MotorConfig.MIN_SPEED <= speed <= MotorConfig.MAX_SPEED:
+                    self.logger.warning(f"Vitesse hors limites: {speed}")
+                    return False
+                
+                # Arrêt programmé : sous le verrou, un arrêt obsolète ne peut
+                # pas s'intercaler entre une nouvelle commande et son effet
+                if timer is not None:
+                    if timer is not self._stop_timer:
+                        return True
+                    self._stop_timer = None
+                else:
+                    self._arm_stop(
+                        duration if command != config.robot.cmd_stop else None
+                    )
+                
+                # Même mouvement à une vitesse quasi identique (bruit du
+                # joystick) : ni écriture moteur ni notification
+                deadband = config.robot.speed_deadband
+                if (command == self.current_command
+                        and command != config.robot.cmd_stop
+                        and abs(speed - self.current_speed) < deadband):
+                    return True
+                
+                if command == config.robot.cmd_stop:
+                    speed = 0.0
+                
+                # Publie la consigne au thread moteur
+                self._target = (command, speed)
+                self._target_event.set()
                 
                 # Met à jour l'état
                 old_command = self.current_command
@@ -121,19 +209,39 @@ class RobotService:
                 self.current_speed = speed
                 self.is_moving = command != "stop"
                 self.last_command_time = time.time()
-                
-                # Log uniquement si la commande change
-                if old_command != command:
-                    self.logger.info(f"Commande exécutée: {command} (vitesse: {speed:.2f})")
-                
-                # Notifie les callbacks
-                self._notify_state_change()
-                
-                return True
+                # Instantané pris sous le verrou : chaque notification porte
+                # l'état produit par sa propre commande
+                state = self.get_state()
+                self._state_seq += 1
+                seq = self._state_seq
                 
             except Exception as e:
                 self.logger.error(f"Erreur lors de l'exécution de la commande {command}: {e}")
                 return False
+        
+        # Hors du verrou : le formatage et les callbacks (diffusion WebSocket)
+        # ne retardent pas les commandes suivantes
+        
+        # Log uniquement si la commande change
+        if old_command != command:
+            self.logger.info(f"Commande exécutée: {command} (vitesse: {speed:.2f})")
+        
+        # Notifie les callbacks
+        self._notify_state_change(state, seq)
+        
+        return True
+    
+    def _arm_stop(self, duration: float | None):
+        """Remplace l'arrêt programmé (appelé sous le verrou)"""
+        if self._stop_timer is not None:
+            self._stop_timer.cancel()
+            self._stop_timer = None
+        if duration is not None and duration > 0:
+            timer = Timer(duration, lambda: self._timed_stop(timer))
+            timer.daemon = True
+            timer.name = "RobotService-stop"
+            self._stop_timer = timer
+            timer.start()
     
     def move_with_joystick(self, axis_x: float, axis_y: float) -> bool:
         """
@@ -188,6 +296,10 @@ class RobotService:
     def cleanup(self):
         """Nettoie les ressources du robot"""
         if self.robot:
+            with self._lock:
+                self._arm_stop(None)
+            self._target = (config.robot.cmd_stop, 0.0)
+            self._target_event.set()
             self.robot.stop()
             # RobotCar n'a pas de méthode cleanup, on fait juste stop()
             self.logger.info("Robot nettoyé")
@@ -3,12 +3,13 @@ Serveur MCP (Model Context Protocol) pour le robot Hadron2
 Utilise FastMCP pour une intégration simplifiée et efficace
 """
 
-import asyncio
+import binascii
 import os
 import sys
+from collections.abc import Callable
 from typing import Any
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Image
 
 # Import des services du robot
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -55,8 +56,11 @@ def robot_move(
         # Convertit la vitesse de pourcentage à échelle 0-1
         normalized_speed = min(max(speed / 100.0, 0.0), 1.0)
         
-        # Exécute la commande de mouvement
-        success = robot_service.execute_command(direction, normalized_speed)
+        # Exécute la commande de mouvement ; le service programme l'arrêt
+        # après la durée, annulé par toute commande suivante
+        success = robot_service.execute_command(
+            direction, normalized_speed, duration
+        )
         
         if not success:
             return {
@@ -64,14 +68,6 @@ def robot_move(
                 "error": f"Échec de l'exécution de la commande: {direction}"
             }
         
-        # Si une durée est spécifiée et ce n'est pas "stop", programme l'arrêt
-        if duration > 0 and direction != "stop":
-            async def stop_after_duration():
-                await asyncio.sleep(duration)
-                robot_service.execute_command("stop")
-            
-            asyncio.create_task(stop_after_duration())
-        
         return {
             "success": True,
             "command": direction,
@@ -125,6 +121,85 @@ def robot_joystick_control(axis_x: float, axis_y: float) -> dict[str, Any]:
         }
 
 
+# Dernière frame encodée en base64 : plusieurs captures de la même frame
+# ne l'encodent qu'une fois
+_encoded_frame: tuple[bytes, str] | None = None
+
+
+def _frame_base64(frame: bytes) -> str:
+    """Encode une frame JPEG en base64 (mise en cache par frame)"""
+    global _encoded_frame
+    cached = _encoded_frame
+    if cached is not None and cached[0] is frame:
+        return cached[1]
+    encoded = binascii.b2a_base64(frame, newline=False).decode("ascii")
+    _encoded_frame = (frame, encoded)
+    return encoded
+
+
+def _camera_status() -> dict[str, Any]:
+    """Statistiques de capture"""
+    stats = camera_service.get_stats()
+    return {
+        "success": True,
+        "action": "status",
+        "status": {
+            "is_running": camera_service.is_running,
+            "fps": stats["current_fps"],
+            "frames_captured": stats["frames_captured"],
+            "frames_dropped": stats["frames_dropped"]
+        }
+    }
+
+
+def _camera_start() -> dict[str, Any]:
+    """Démarre la capture"""
+    success = camera_service.start_capture()
+    return {
+        "success": success,
+        "action": "start",
+        "message": "Flux vidéo démarré" if success else "Erreur de démarrage"
+    }
+
+
+def _camera_stop() -> dict[str, Any]:
+    """Arrête la capture"""
+    camera_service.stop_capture()
+    return {
+        "success": True,
+        "action": "stop",
+        "message": "Flux vidéo arrêté"
+    }
+
+
+def _camera_capture() -> dict[str, Any]:
+    """Retourne la dernière frame JPEG en base64"""
+    frame = camera_service.get_latest_frame()
+    if frame is None:
+        return {
+            "success": False,
+            "action": "capture",
+            "error": "Aucune image disponible"
+        }
+    return {
+        "success": True,
+        "action": "capture",
+        "message": "Image capturée",
+        "format": "jpeg",
+        "size": len(frame),
+        "image_base64": _frame_base64(frame)
+    }
+
+
+# Action de robot_camera vers son gestionnaire
+_CAMERA_ACTIONS: dict[str, Callable[[], dict[str, Any]]] = {
+    "status": _camera_status,
+    "start": _camera_start,
+    "stop": _camera_stop,
+    "capture": _camera_capture,
+}
+
+
 @mcp.tool()
 def robot_camera(action: str) -> dict[str, Any]:
     """
@@ -139,53 +214,15 @@ def robot_camera(action: str) -> dict[str, Any]:
             "error": "Service caméra non disponible (mode simulation)"
         }
     
+    handler = _CAMERA_ACTIONS.get(action)
+    if handler is None:
+        return {
+            "success": False,
+            "error": f"Action inconnue: {action}"
+        }
+    
     try:
-        if action == "status":
-            stats = camera_service.get_stats()
-            return {
-                "success": True,
-                "action": action,
-                "status": {
-                    "is_running": camera_service.is_running,
-                    "fps": stats["fps"],
-                    "frames_captured": stats["frames_captured"],
-                    "frames_dropped": stats["frames_dropped"]
-                }
-            }
-        elif action == "start":
-            success = camera_service.start()
-            return {
-                "success": success,
-                "action": action,
-                "message": "Flux vidéo démarré" if success else "Erreur de démarrage"
-            }
-        elif action == "stop":
-            camera_service.stop()
-            return {
-                "success": True,
-                "action": action,
-                "message": "Flux vidéo arrêté"
-            }
-        elif action == "capture":
-            frame = camera_service.get_latest_frame()
-            if frame is not None:
-                return {
-                    "success": True,
-                    "action": action,
-                    "message": "Image capturée",
-                    "frame_shape": frame.shape
-                }
-            else:
-                return {
-                    "success": False,
-                    "action": action,
-                    "error": "Aucune image disponible"
-                }
-        else:
-            return {
-                "success": False,
-                "error": f"Action inconnue: {action}"
-            }
+        return handler()
     except Exception as e:
         return {
             "success": False,
@@ -193,6 +230,23 @@ def robot_camera(action: str) -> dict[str, Any]:
         }
 
 
+@mcp.tool()
+def robot_snapshot() -> Image:
+    """
+    Retourne la dernière image de la caméra.
+    
+    Transmise comme contenu image MCP (JPEG) : le client l'affiche ou la
+    passe au modèle directement, sans JSON intermédiaire.
+    """
+    if not camera_service:
+        raise ValueError("Service caméra non disponible (mode simulation)")
+    
+    frame = camera_service.get_latest_frame()
+    if frame is None:
+        raise ValueError("Aucune image disponible")
+    return Image(data=frame, format="jpeg")
+
+
 @mcp.tool()
 def robot_status() -> dict[str, Any]:
     """
@@ -5,7 +5,6 @@ This example demonstrates how to use the DecoratorRouter to create
 a FastMCP server that supports tools, resources, and prompts.
 """
 
-import asyncio
 import uvicorn
 from fastapi import FastAPI, WebSocket
 import logging
@@ -87,8 +86,11 @@ async def robot_move(message: Dict[str, Any], websocket: WebSocket):
         # Convertit la vitesse de pourcentage à échelle 0-1
         normalized_speed = min(max(speed / 100.0, 0.0), 1.0)
         
-        # Exécute la commande de mouvement
-        success = robot_service.execute_command(direction, normalized_speed)
+        # Exécute la commande de mouvement ; le service programme l'arrêt
+        # après la durée, annulé par toute commande suivante
+        success = robot_service.execute_command(
+            direction, normalized_speed, duration
+        )
         
         if not success:
             return {
@@ -96,14 +98,6 @@ async def robot_move(message: Dict[str, Any], websocket: WebSocket):
                 "error": f"Échec de l'exécution de la commande: {direction}"
             }
         
-        # Si une durée est spécifiée et ce n'est pas "stop", programme l'arrêt
-        if duration > 0 and direction != "stop":
-            async def stop_after_duration():
-                await asyncio.sleep(duration)
-                robot_service.execute_command("stop")
-            
-            asyncio.create_task(stop_after_duration())
-        
         return {
             "success": True,
             "command": direction,
@@ -179,20 +173,20 @@ async def robot_camera(action: str) -> dict[str, Any]:
                 "action": action,
                 "status": {
                     "is_running": camera_service.is_running,
-                    "fps": stats["fps"],
+                    "fps": stats["current_fps"],
                     "frames_captured": stats["frames_captured"],
                     "frames_dropped": stats["frames_dropped"]
                 }
             }
         elif action == "start":
-            success = camera_service.start()
+            success = camera_service.start_capture()
             return {
                 "success": success,
                 "action": action,
                 "message": "Flux vidéo démarré" if success else "Erreur de démarrage"
             }
         elif action == "stop":
-            camera_service.stop()
+            camera_service.stop_capture()
             return {
                 "success": True,
                 "action": action,
@@ -205,7 +199,8 @@ async def robot_camera(action: str) -> dict[str, Any]:
                     "success": True,
                     "action": action,
                     "message": "Image capturée",
-                    "frame_shape": frame.shape
+                    "format": "jpeg",
+                    "size": len(frame)
                 }
             else:
                 return {
@@ -5,16 +5,20 @@ callbacks, configuration et monitoring.
 
 import glob
 import logging
+import os
+import select
 import struct
 import time
 from collections.abc import Callable, Generator
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
-
+from typing import Any, NamedTuple
 
 # Configuration et constantes
+AXIS_SCALE = 1.0 / 32767.0  # Valeur brute d'axe vers [-1.0, 1.0]
+
+
 class EventType(Enum):
     """Types d'événements joystick selon la spécification Linux input"""
     INIT = 0x80  # Événement d'initialisation
@@ -28,7 +32,15 @@ class ButtonState(Enum):
     PRESSED = 1
 
 
-@dataclass
+class RawEvent(NamedTuple):
+    """Événement brut tel que lu sur le périphérique (ordre du format "IhBB")"""
+    time: int
+    value: int
+    type: int
+    number: int
+
+
+@dataclass(slots=True)
 class JoystickEvent:
     """Représente un événement joystick structuré"""
     timestamp: int
@@ -41,7 +53,8 @@ class JoystickEvent:
     def normalized_value(self) -> float:
         """Retourne la valeur normalisée pour les axes (-1.0 à 1.0)"""
         if self.event_type == EventType.AXIS:
-            return self.value / 32767.0
+            # -32768 donnerait une valeur légèrement inférieure à -1.0
+            return max(-1.0, self.value * AXIS_SCALE)
         return float(self.value)
 
 
@@ -72,6 +85,15 @@ class DeviceInfo:
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Nombre maximal d'événements lus par appel système
+READ_BATCH_EVENTS = 64
+
+# Attente maximale dans epoll avant de revérifier l'arrêt et le timeout (s)
+POLL_INTERVAL = 0.5
+
+# Types bruts (hors drapeau d'initialisation) vers EventType
+_EVENT_TYPES = {0x01: EventType.BUTTON, 0x02: EventType.AXIS}
+
 
 class JoystickReader:
     """Lecteur d'événements joystick avancé avec support de configuration et callbacks."""
@@ -84,12 +106,14 @@ class JoystickReader:
         """
         self._config = config or JoystickConfig()
         self._event_format = "IhBB"  # (time, value, type, number)
-        self._event_size = struct.calcsize(self._event_format)
+        self._event_struct = struct.Struct(self._event_format)
+        self._event_size = self._event_struct.size
         self._callbacks: dict[EventType, list[Callable[[JoystickEvent], None]]] = {
             EventType.BUTTON: [],
             EventType.AXIS: [],
             EventType.INIT: []
         }
+        self._batch_callbacks: list[Callable[[], None]] = []
         self._device_info: DeviceInfo | None = None
         self._is_running = False
         self._event_count = 0
@@ -182,6 +206,17 @@ class JoystickReader:
         self._callbacks[event_type].append(callback)
         logger.debug(f"Callback ajouté pour {event_type.name}")
 
+    def add_batch_callback(self, callback: Callable[[], None]) -> None:
+        """Ajoute un callback appelé après chaque lot d'événements lu.
+        
+        Permet de n'agir qu'une fois sur l'état final d'une rafale
+        d'événements (ex: X et Y modifiés par le même mouvement).
+        
+        Args:
+            callback: Fonction sans argument à appeler en fin de lot
+        """
+        self._batch_callbacks.append(callback)
+
     def remove_callback(
         self, 
         event_type: EventType, 
@@ -206,7 +241,7 @@ class JoystickReader:
     def _normalize_axis_value(self, raw_value: int) -> float:
         """Normalise une valeur d'axe brute en valeur flottante [-1.0, 1.0]."""
         # Les valeurs d'axe vont généralement de -32768 à 32767
-        normalized = raw_value / 32767.0
+        normalized = raw_value * AXIS_SCALE
         
         # Appliquer la zone morte
         if abs(normalized) < self._config.deadzone:
@@ -218,30 +253,29 @@ class JoystickReader:
         # S'assurer que la valeur reste dans [-1.0, 1.0]
         return max(-1.0, min(1.0, normalized))
 
-    def _process_event(self, raw_event: dict[str, Any]) -> JoystickEvent | None:
+    def _process_event(self, raw_event: RawEvent) -> JoystickEvent | None:
         """Traite un événement brut et le convertit en JoystickEvent."""
         try:
             # Déterminer le type d'événement
-            raw_type = raw_event["type"]
+            raw_type = raw_event.type
             
             if raw_type & 0x80:  # Événement d'initialisation
                 if not self._config.enable_init_events:
                     return None
                 event_type = EventType.INIT
-            elif raw_type == 0x01:  # Bouton
-                event_type = EventType.BUTTON
-            elif raw_type == 0x02:  # Axe
-                event_type = EventType.AXIS
             else:
-                logger.debug(f"Type d'événement inconnu: {raw_type}")
-                return None
+                # Bouton (0x01) ou axe (0x02)
+                event_type = _EVENT_TYPES.get(raw_type)
+                if event_type is None:
+                    logger.debug(f"Type d'événement inconnu: {raw_type}")
+                    return None
             
             # Créer l'événement structuré
             event = JoystickEvent(
-                timestamp=raw_event["time"],
+                timestamp=raw_event.time,
                 event_type=event_type,
-                number=raw_event["number"],
-                value=raw_event["value"],
+                number=raw_event.number,
+                value=raw_event.value,
                 raw_type=raw_type
             )
             
@@ -275,7 +309,18 @@ class JoystickReader:
         logger.info(f"Début de lecture des événements sur {self._config.device_path}")
         
         try:
-            with open(self._config.device_path, "rb") as device:
+            # Lecture non bufferisée : os.read rend les événements disponibles
+            # sans attendre que le lot soit complet
+            with (
+                open(self._config.device_path, "rb", buffering=0) as device,
+                select.epoll() as poller,
+            ):
+                fd = device.fileno()
+                read_size = self._event_size * READ_BATCH_EVENTS
+                
+                # Le noyau réveille le thread uniquement quand des événements
+                # sont prêts ; le délai permet de prendre en compte stop()
+                poller.register(fd, select.EPOLLIN)
                 
                 while self._is_running:
                     # Vérifier le timeout
@@ -284,25 +329,26 @@ class JoystickReader:
                         logger.info("Timeout atteint, arrêt de la lecture")
                         break
                     
-                    # Lire l'événement brut
-                    try:
-                        raw_data = device.read(self._event_size)
-                        if not raw_data:
-                            logger.debug("Fin des données, arrêt de la lecture")
-                            break
-                        
-                        # Décomposer l'événement
-                        timestamp, value, event_type, number = struct.unpack(
-                            self._event_format, raw_data
-                        )
-                        
-                        raw_event = {
-                            "time": timestamp,
-                            "value": value,
-                            "type": event_type,
-                            "number": number,
-                        }
-                        
+                    if not poller.poll(POLL_INTERVAL):
+                        continue
+                    
+                    # Lire un lot d'événements bruts
+                    raw_data = os.read(fd, read_size)
+                    if not raw_data:
+                        logger.debug("Fin des données, arrêt de la lecture")
+                        break
+                    
+                    # Ignorer un éventuel événement tronqué en fin de lot
+                    usable = len(raw_data) - len(raw_data) % self._event_size
+                    if usable != len(raw_data):
+                        logger.error("Événement tronqué ignoré")
+                        self._error_count += 1
+                        raw_data = raw_data[:usable]
+                    
+                    # Décomposer les événements du lot
+                    for raw_event in map(
+                        RawEvent._make, self._event_struct.iter_unpack(raw_data)
+                    ):
                         # Traiter l'événement
                         event = self._process_event(raw_event)
                         if event:
@@ -313,11 +359,13 @@ class JoystickReader:
                             
                             # Yielder l'événement
                             yield event
-                            
-                    except struct.error as e:
-                        logger.error(f"Erreur de décodage: {e}")
-                        self._error_count += 1
-                        continue
+                    
+                    # Lot entièrement traité
+                    for callback in self._batch_callbacks:
+                        try:
+                            callback()
+                        except Exception as e:
+                            logger.error(f"Erreur dans callback de fin de lot: {e}")
                     
         except FileNotFoundError:
             error_msg = (
@@ -12,6 +12,7 @@ import sys
 from config import config, configure_for_development, configure_for_production
 from core.camera_service import camera_service
 from core.joystick_service import joystick_service
+from core.realtime import run_loop
 
 # Services principaux
 from core.robot_service import robot_service
@@ -31,6 +32,8 @@ class Application:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.is_running = False
+        # Signalé (dans la boucle) quand l'arrêt est demandé
+        self._stop_requested = asyncio.Event()
         self._setup_logging()
         self._setup_signal_handlers()
         
@@ -51,12 +54,15 @@ class Application:
     
     def _setup_signal_handlers(self):
         """Configure les gestionnaires de signaux pour un arrêt propre"""
-        def signal_handler(signum, frame):
+        def signal_handler(signum):
             self.logger.info(f"Signal {signum} reçu, arrêt de l'application...")
-            asyncio.create_task(self.stop())
+            self._stop_requested.set()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        # Gestionnaires exécutés dans la boucle asyncio, pas entre deux
+        # instructions de la coroutine interrompue
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, signal_handler, signum)
     
     def _setup_joystick_robot_connection(self):
         """Connecte la manette au robot via callbacks"""
@@ -215,9 +221,8 @@ class Application:
             return
         
         try:
-            # Boucle principale simple
-            while self.is_running:
-                await asyncio.sleep(1)
+            # Attend la demande d'arrêt sans réveil périodique
+            await self._stop_requested.wait()
                 
         except KeyboardInterrupt:
             self.logger.info("Interruption clavier détectée")
@@ -264,7 +269,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_loop(main())
     except KeyboardInterrupt:
         print("\n👋 Au revoir!")
     except Exception as e:
@@ -5,6 +5,16 @@ Wrapper pour FastMCP pour l'intégrer avec l'architecture existante de Hadron2
 import logging
 import subprocess
 
+# Outils déclarés par hadron_mcp/hadron_server.py (liste statique)
+MCP_TOOLS = (
+    "robot_move",
+    "robot_joystick_control",
+    "robot_camera",
+    "robot_snapshot",
+    "robot_status",
+    "emergency_stop",
+)
+
 
 class MCPServerWrapper:
     """Wrapper pour FastMCP qui respecte l'interface attendue par l'application"""
@@ -43,16 +53,10 @@ class MCPServerWrapper:
         # Pour FastMCP en mode intégré, on considère qu'il est toujours "connecté"
         return self.is_running
     
-    def get_tools(self) -> list:
+    def get_tools(self) -> tuple[str, ...]:
         """Retourne la liste des outils disponibles"""
         # FastMCP gère les outils via des décorateurs
-        return [
-            "robot_move",
-            "robot_sensors", 
-            "robot_camera",
-            "robot_status",
-            "emergency_stop"
-        ]
+        return MCP_TOOLS
     
     def execute_tool(self, tool_name: str, **kwargs):
         """Exécute un outil MCP directement"""
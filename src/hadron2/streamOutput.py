@@ -1,14 +1,23 @@
 import io
-from threading import Condition
+from threading import Event
 
 
 # Class to handle streaming output
 class StreamingOutput(io.BufferedIOBase):
     def __init__(self):
         self.frame = None
-        self.condition = Condition()
+        # Single producer (encoder) and single consumer: a plain slot plus
+        # an event is enough, no lock around the reference swap
+        self._event = Event()
 
     def write(self, buf):
-        with self.condition:
-            self.frame = buf
-            self.condition.notify_all()
\ No newline at end of file
+        self.frame = buf
+        self._event.set()
+
+    def wait_frame(self, timeout=None):
+        """Wait for a frame newer than the last one returned (None on timeout)"""
+        if not self._event.wait(timeout):
+            return None
+        # Clear before reading: a frame written meanwhile re-arms the event
+        self._event.clear()
+        return self.frame
@@ -1,14 +1,15 @@
 """
 Service de contrôle web pour les commandes du robot.
-Interface REST FastAPI haute performance.
+Interface REST FastAPI haute performance, servie par uvicorn sur uvloop
+(remplace les anciens serveurs Flask/Werkzeug).
 """
 
-import asyncio
 import logging
 import threading
 
 import uvicorn
 from config import config
+from core.realtime import pin_thread, run_loop
 from core.robot_service import robot_service
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -157,6 +158,8 @@ class ControlServerFastAPI:
         
         try:
             def run_server():
+                # Hors des cœurs de la manette et de l'encoder
+                pin_thread(config.web.server_cpus)
                 config_uvicorn = uvicorn.Config(
                     app=self.app,
                     host=config.web.host,
@@ -165,7 +168,7 @@ class ControlServerFastAPI:
                     access_log=False  # Réduit les logs pour la performance
                 )
                 self.server = uvicorn.Server(config_uvicorn)
-                asyncio.run(self.server.serve())
+                run_loop(self.server.serve())
         
             self.server_thread = threading.Thread(target=run_server, daemon=True)
             self.is_running = True
@@ -1,17 +1,24 @@
 """
 Service de serveur vidéo pour le streaming de la caméra.
-Optimisé pour une latence minimale avec MJPEG streaming.
+Optimisé pour une latence minimale avec MJPEG streaming, servi par uvicorn
+sur uvloop (remplace les anciens serveurs Flask/Werkzeug).
 """
 
 import logging
+import socket
 import threading
 
 import uvicorn
 from config import config
 from core.camera_service import camera_service
-from fastapi import FastAPI
+from core.realtime import pin_thread, run_loop
+from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 
+# En-tête multipart d'une frame ; le CRLF de tête termine la partie
+# précédente (ignoré en préambule pour la première)
+_PART_HEADER = b"\r\n--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n"
+
 
 class VideoServer:
     """Serveur de streaming vidéo MJPEG haute performance avec FastAPI"""
@@ -24,6 +31,7 @@ class VideoServer:
         )
         self.server_thread: threading.Thread | None = None
         self.server: uvicorn.Server | None = None
+        self._socket: socket.socket | None = None
         self.is_running = False
         self.logger = logging.getLogger(__name__)
         
@@ -40,6 +48,16 @@ class VideoServer:
                 media_type="multipart/x-mixed-replace; boundary=frame"
             )
         
+        @self.app.get("/video_feed_h264")
+        async def video_feed_h264():
+            """Flux H.264 brut (Annex-B), moins gourmand en bande passante"""
+            if not camera_service.h264_output:
+                raise HTTPException(status_code=404, detail="Flux H.264 désactivé")
+            return StreamingResponse(
+                camera_service.async_h264_generator(),
+                media_type="video/h264"
+            )
+        
         @self.app.get("/video_stats")
         async def video_stats():
             """Route pour les statistiques vidéo"""
@@ -54,14 +72,16 @@ class VideoServer:
                 "is_streaming": self.is_running
             }
     
-    def _generate_frames(self):
-        """Générateur de frames pour le streaming MJPEG"""
-        for frame_data in camera_service.frame_generator():
+    async def _generate_frames(self):
+        """Générateur asynchrone de frames pour le streaming MJPEG"""
+        async for frame_data in camera_service.async_frame_generator():
             if not self.is_running:
                 break
             
-            yield (b"--frame\r\n"
-                   b"Content-Type: image/jpeg\r\n\r\n" + frame_data + b"\r\n")
+            # Deux écritures par frame : l'en-tête (quelques dizaines d'octets)
+            # puis la frame elle-même, jamais recopiée dans un nouveau bytes
+            yield _PART_HEADER % len(frame_data)
+            yield memoryview(frame_data)
     
     def start(self) -> bool:
         """Démarre le serveur vidéo FastAPI"""
@@ -75,6 +95,9 @@ class VideoServer:
                 self.logger.error("Impossible de démarrer la capture vidéo")
                 return False
             
+            # Socket d'écoute réglée pour le flux (héritée par les connexions)
+            self._socket = self._create_listen_socket()
+            
             # Configuration du serveur uvicorn
             uvicorn_config = uvicorn.Config(
                 app=self.app,
@@ -102,18 +125,51 @@ class VideoServer:
         except Exception as e:
             self.logger.error(f"Erreur lors du démarrage du serveur vidéo: {e}")
             self.is_running = False
+            self._close_socket()
             return False
     
+    @staticmethod
+    def _create_listen_socket() -> socket.socket:
+        """
+        Crée la socket d'écoute du serveur vidéo
+        
+        Sous Linux les sockets acceptées héritent de TCP_NODELAY et de
+        SO_SNDBUF : chaque JPEG part immédiatement (pas de Nagle) et un
+        tampon d'envoi réduit évite d'accumuler des images périmées dans le
+        noyau quand le client ralentit.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, config.web.video_send_buffer
+            )
+            sock.bind((config.web.host, config.web.video_port))
+            sock.listen(socket.SOMAXCONN)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    
+    def _close_socket(self):
+        """Ferme la socket d'écoute si elle est encore ouverte"""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+    
     def _run_server(self):
         """Lance le serveur uvicorn"""
+        # Hors des cœurs de la manette et de l'encoder
+        pin_thread(config.web.server_cpus)
         try:
             if self.server:
-                import asyncio
-                asyncio.run(self.server.serve())
+                run_loop(self.server.serve(sockets=[self._socket]))
         except Exception as e:
             self.logger.error(f"Erreur du serveur vidéo: {e}")
         finally:
             self.is_running = False
+            self._close_socket()
     
     def stop(self):
         """Arrête le serveur vidéo"""
@@ -125,6 +181,12 @@ class VideoServer:
         if self.server:
             self.server.should_exit = True
         
+        # uvicorn rend la main une fois les connexions fermées ; la socket
+        # n'est fermée qu'ensuite pour ne pas la retirer sous ses pieds
+        if self.server_thread and self.server_thread.is_alive():
+            self.server_thread.join(timeout=5.0)
+        self._close_socket()
+        
         self.logger.info("Serveur vidéo arrêté")
     
     def get_stream_url(self) -> str:
@@ -1,11 +1,22 @@
 """
 Service WebSocket pour la communication temps réel.
 Optimisé pour une latence minimale avec mise à jour à haute fréquence.
+
+L'état du robot est diffusé en binaire (15 octets, little-endian) :
+    B  type de message (1 = robot_state)
+    B  commande (0 = stop, 1 = avant, 2 = arrière, 3 = gauche, 4 = droite,
+       255 = inconnue)
+    B  drapeaux (bit 0 = is_moving, bit 1 = is_connected)
+    f  vitesse
+    d  horodatage (secondes epoch)
+Les autres messages restent en JSON.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+import struct
 import time
 from typing import Any, Optional
 
@@ -16,6 +27,46 @@ from core.joystick_service import joystick_service
 from core.robot_service import robot_service
 from websockets.server import WebSocketServerProtocol
 
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        # Texte (et non bytes) pour rester en trames texte côté client ;
+        # les boutons de la manette ont des clés entières
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    _loads = orjson.loads
+except ImportError:
+    # orjson absent : module json standard
+    _dumps = json.dumps
+    _loads = json.loads
+
+# Format binaire de l'état du robot
+ROBOT_STATE_STRUCT = struct.Struct("<BBBfd")
+MSG_ROBOT_STATE = 1
+# Noms configurés (config.robot.cmd_*) : ceux que RobotService publie
+ROBOT_COMMANDS = (
+    config.robot.cmd_stop,
+    config.robot.cmd_forward,
+    config.robot.cmd_backward,
+    config.robot.cmd_left,
+    config.robot.cmd_right,
+)
+_COMMAND_CODES = {command: code for code, command in enumerate(ROBOT_COMMANDS)}
+_UNKNOWN_COMMAND = 255
+
+
+def pack_robot_state(state: dict[str, Any]) -> bytes:
+    """Encode l'état du robot au format binaire diffusé aux clients"""
+    flags = (1 if state["is_moving"] else 0) | (2 if state["is_connected"] else 0)
+    return ROBOT_STATE_STRUCT.pack(
+        MSG_ROBOT_STATE,
+        _COMMAND_CODES.get(state["command"], _UNKNOWN_COMMAND),
+        flags,
+        state["speed"],
+        state["last_command_time"]
+    )
+
 
 class WebSocketServer:
     """Serveur WebSocket pour communication temps réel"""
@@ -26,13 +77,18 @@ class WebSocketServer:
         self.is_running = False
         self.logger = logging.getLogger(__name__)
         
-        # Fréquence d'envoi des mises à jour
-        self.update_frequency = config.web.websocket_frequency
+        # Fréquence maximale de diffusion des états (l'œil ne suit pas au-delà)
+        self.update_frequency = config.web.status_broadcast_frequency
         self.update_interval = 1.0 / self.update_frequency
         
-        # Dernières données envoyées pour éviter les doublons
-        self.last_state = {}
-        self.last_update_time = 0.0
+        # Derniers états publiés par les services (remplacés, jamais empilés)
+        self._pending_robot_state: dict[str, Any] | None = None
+        self._pending_joystick_state: dict[str, Any] | None = None
+        
+        # Coroutine de diffusion et son réveil (les callbacks viennent d'autres threads)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending_event: asyncio.Event | None = None
+        self._broadcast_task: asyncio.Task | None = None
         
         # Configuration des callbacks
         self._setup_service_callbacks()
@@ -51,26 +107,53 @@ class WebSocketServer:
     
     def _on_robot_state_change(self, state: dict[str, Any]):
         """Callback appelé lors des changements d'état du robot"""
-        self._broadcast_message({
-            "type": "robot_state",
-            "data": state,
-            "timestamp": time.time()
-        })
+        self._pending_robot_state = state
+        self._wake_broadcaster()
     
     def _on_joystick_state_change(self, state: dict[str, Any]):
         """Callback appelé lors des changements d'état de la manette"""
-        # Évite d'envoyer trop de messages pour les axes
-        current_time = time.time()
-        if current_time - self.last_update_time < self.update_interval:
+        self._pending_joystick_state = state
+        self._wake_broadcaster()
+    
+    def _wake_broadcaster(self):
+        """Réveille la coroutine de diffusion depuis n'importe quel thread"""
+        if self._loop is None or not self.clients:
             return
+        # RuntimeError : boucle fermée pendant l'arrêt
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._pending_event.set)
+    
+    async def _status_broadcaster(self):
+        """
+        Diffuse les états en attente à tous les clients
         
-        self._broadcast_message({
-            "type": "joystick_state",
-            "data": state,
-            "timestamp": current_time
-        })
+        Un seul encodage par état quel que soit le nombre de clients, et au
+        plus une diffusion par intervalle : la charge ne dépend ni du débit
+        des commandes entrantes ni du nombre de clients.
+        """
+        last_robot_state = None
+        last_joystick_state = None
         
-        self.last_update_time = current_time
+        while self.is_running:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            
+            robot_state = self._pending_robot_state
+            if robot_state is not None and robot_state is not last_robot_state:
+                last_robot_state = robot_state
+                self._send_to_all_clients(pack_robot_state(robot_state))
+            
+            joystick_state = self._pending_joystick_state
+            if joystick_state is not None and joystick_state is not last_joystick_state:
+                last_joystick_state = joystick_state
+                self._send_to_all_clients(_dumps({
+                    "type": "joystick_state",
+                    "data": joystick_state,
+                    "timestamp": time.time()
+                }))
+            
+            # Limite la fréquence de diffusion
+            await asyncio.sleep(self.update_interval)
     
     async def _handle_client(self, websocket: WebSocketServerProtocol, path: str):
         """Gestionnaire pour les connexions client WebSocket"""
@@ -109,7 +192,7 @@ class WebSocketServer:
                 "timestamp": time.time()
             }
             
-            await websocket.send(json.dumps(initial_state))
+            await websocket.send(_dumps(initial_state))
             
         except Exception as e:
             self.logger.error(f"Erreur lors de l'envoi de l'état initial: {e}")
@@ -117,7 +200,7 @@ class WebSocketServer:
     async def _handle_message(self, websocket: WebSocketServerProtocol, message: str):
         """Traite un message reçu du client"""
         try:
-            data = json.loads(message)
+            data = _loads(message)
             message_type = data.get("type")
             payload = data.get("data", {})
             
@@ -150,7 +233,7 @@ class WebSocketServer:
         
         success = robot_service.execute_command(command, speed)
         
-        await websocket.send(json.dumps({
+        await websocket.send(_dumps({
             "type": "command_result",
             "success": success,
             "command": command,
@@ -172,7 +255,7 @@ class WebSocketServer:
         """Traite un arrêt d'urgence"""
         success = robot_service.emergency_stop()
         
-        await websocket.send(json.dumps({
+        await websocket.send(_dumps({
             "type": "emergency_stop_result",
             "success": success,
             "timestamp": time.time()
@@ -186,7 +269,7 @@ class WebSocketServer:
             "joystick": joystick_service.get_state()
         }
         
-        await websocket.send(json.dumps({
+        await websocket.send(_dumps({
             "type": "status",
             "data": status,
             "timestamp": time.time()
@@ -194,50 +277,24 @@ class WebSocketServer:
     
     async def _send_error(self, websocket: WebSocketServerProtocol, error: str):
         """Envoie un message d'erreur"""
-        await websocket.send(json.dumps({
+        await websocket.send(_dumps({
             "type": "error",
             "error": error,
             "timestamp": time.time()
         }))
     
-    def _broadcast_message(self, message: dict[str, Any]):
-        """Diffuse un message à tous les clients connectés"""
-        if not self.clients:
-            return
-        
-        message_str = json.dumps(message)
+    def _send_to_all_clients(self, message: str | bytes):
+        """
+        Diffuse un message à tous les clients
         
-        # Envoie de manière asynchrone
-        asyncio.create_task(self._send_to_all_clients(message_str))
-    
-    async def _send_to_all_clients(self, message: str):
-        """Envoie un message à tous les clients (coroutine)"""
+        Le message est encodé une seule fois en trame WebSocket puis écrit
+        sur chaque connexion sans attendre son vidage : un client lent ne
+        retarde pas les autres. Les connexions fermées sont ignorées et
+        retirées par leur gestionnaire.
+        """
         if not self.clients:
             return
-        
-        # Copie la liste des clients pour éviter les modifications concurrentes
-        clients = self.clients.copy()
-        
-        # Envoie à tous les clients en parallèle
-        tasks = []
-        for client in clients:
-            task = asyncio.create_task(self._safe_send(client, message))
-            tasks.append(task)
-        
-        # Attend que tous les envois se terminent
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def _safe_send(self, websocket: WebSocketServerProtocol, message: str):
-        """Envoie un message de manière sécurisée"""
-        try:
-            await websocket.send(message)
-        except websockets.exceptions.ConnectionClosed:
-            # Client déconnecté, supprime de la liste
-            self.clients.discard(websocket)
-        except Exception as e:
-            self.logger.error(f"Erreur lors de l'envoi à un client: {e}")
-            self.clients.discard(websocket)
+        websockets.broadcast(self.clients, message)
     
     async def start(self) -> bool:
         """Démarre le serveur WebSocket"""
@@ -257,6 +314,12 @@ class WebSocketServer:
             )
             
             self.is_running = True
+            
+            # Démarre la diffusion des états
+            self._loop = asyncio.get_running_loop()
+            self._pending_event = asyncio.Event()
+            self._broadcast_task = asyncio.create_task(self._status_broadcaster())
+            
             self.logger.info(f"Serveur WebSocket démarré sur ws://{config.web.host}:{config.web.websocket_port}")
             return True
             
@@ -271,6 +334,10 @@ class WebSocketServer:
         
         self.is_running = False
         
+        if self._broadcast_task:
+            self._broadcast_task.cancel()
+            self._broadcast_task = None
+        
         if self.server:
             self.server.close()
             await self.server.wait_closed()